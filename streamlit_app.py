@@ -1,9 +1,15 @@
 import streamlit as st
-import pandas as pd
-from summarizer_module import TextSummarizer
+from summarizer_module import TextSummarizer, get_default_device, is_onnx_model_dir
 import time
 import io
-import PyPDF2
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import shutil
+import subprocess
+import fitz  # PyMuPDF
 import traceback
 
 # Streamlit page settings
@@ -14,29 +20,159 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load model into session state
-if 'summarizer' not in st.session_state:
-    st.session_state.summarizer = None
+# Distilled checkpoints first: fewer decoder layers means faster generation
+AVAILABLE_MODELS = [
+    "sshleifer/distilbart-cnn-12-6",
+    "sshleifer/distilbart-cnn-6-6",
+    "facebook/bart-large-cnn",
+]
 
-def load_summarizer():
-    if st.session_state.summarizer is None:
-        with st.spinner("Loading AI model..."):
-            st.session_state.summarizer = TextSummarizer()
-    return st.session_state.summarizer
+# Prefer a local INT8 ONNX export (see summarizer_module) when one is present
+ONNX_MODEL_DIR = os.environ.get("SUMMARIZER_ONNX_DIR", "bart_onnx_int8")
+if is_onnx_model_dir(ONNX_MODEL_DIR):
+    AVAILABLE_MODELS.insert(0, ONNX_MODEL_DIR)
+
+# Load each model once per process and share it across all sessions
+@st.cache_resource(show_spinner="Loading AI model...")
+def load_summarizer(model_name):
+    return TextSummarizer(model_name=model_name)
+
+# Finished summaries shared across sessions, so re-running identical input skips
+# the model. A plain dict (instead of st.cache_data) lets cache misses still stream.
+SUMMARY_CACHE_SIZE = 128
+
+@st.cache_resource
+def _summary_cache():
+    return threading.Lock(), OrderedDict()
+
+def _text_digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def _summary_key(text, length, model_name):
+    return _text_digest(text), length, model_name
+
+def get_cached_summary(key):
+    lock, cache = _summary_cache()
+    with lock:
+        if key in cache:
+            cache.move_to_end(key)
+        return cache.get(key)
+
+def store_summary(key, summary):
+    lock, cache = _summary_cache()
+    with lock:
+        cache[key] = summary
+        cache.move_to_end(key)
+        while len(cache) > SUMMARY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+# Keep the latest tokenized input per session (plus encoder outputs for short,
+# single-chunk text), so summarizing it at another length skips that work
+def get_encoded_input(summarizer, text, model_name):
+    key = (_text_digest(text), model_name)
+    cached = st.session_state.get("encoded_input")
+    if cached is None or cached[0] != key:
+        cached = (key, summarizer.encode(text))
+        st.session_state.encoded_input = cached
+    return cached[1]
+
+# Poppler's pdftotext is much faster than any Python parser; use it when installed
+PDFTOTEXT = shutil.which("pdftotext")
+
+# Long PDFs are split into page ranges extracted by concurrent pdftotext processes
+PDF_PARALLEL_MIN_PAGES = 16
+PDF_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+def _pdftotext(pdf_bytes, first_page=None, last_page=None):
+    command = [PDFTOTEXT, "-q"]
+    if first_page is not None:
+        command += ["-f", str(first_page), "-l", str(last_page)]
+    result = subprocess.run(
+        command + ["-", "-"],
+        input=pdf_bytes,
+        capture_output=True,
+        check=True
+    )
+    return result.stdout.decode("utf-8", "ignore")
+
+def _pdftotext_parallel(pdf_bytes):
+    try:
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            page_count = doc.page_count
+    except RuntimeError:
+        # MuPDF cannot parse every file poppler can (FileDataError is a RuntimeError)
+        return _pdftotext(pdf_bytes)
+    if page_count < PDF_PARALLEL_MIN_PAGES or PDF_MAX_WORKERS == 1:
+        return _pdftotext(pdf_bytes)
+
+    # Threads suffice here: each one only waits on its own pdftotext process
+    step = -(-page_count // PDF_MAX_WORKERS)
+    page_ranges = [(first, min(first + step - 1, page_count)) for first in range(1, page_count + 1, step)]
+    with ThreadPoolExecutor(max_workers=len(page_ranges)) as executor:
+        return "".join(executor.map(lambda pages: _pdftotext(pdf_bytes, *pages), page_ranges))
+
+# A PDF is treated as scanned/image-only when none of its pages have text
+PDF_EMPTY_PAGE_LIMIT = 10
+SCANNED_PDF_MESSAGE = "PDF appears to be scanned/image-only; OCR required."
+
+def _join_page_texts(page_texts):
+    # Shared by both extractors so they reject the same PDFs; "" if no page has text
+    return "\n".join(text for text in page_texts if text.strip())
+
+def _has_text_layer(doc, first_page):
+    # Text needs fonts, and listing page fonts is much cheaper than extracting text
+    return any(doc.get_page_fonts(pno) for pno in range(first_page, doc.page_count))
+
+# MuPDF is not thread-safe, so the fallback parser walks pages sequentially
+def _pymupdf(pdf_bytes):
+    texts = []
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for pno in range(doc.page_count):
+            # After PDF_EMPTY_PAGE_LIMIT empty leading pages, skip extracting the
+            # rest when no later page has a text layer at all
+            if pno == PDF_EMPTY_PAGE_LIMIT and not any(t.strip() for t in texts) \
+                    and not _has_text_layer(doc, pno):
+                break
+            texts.append(doc[pno].get_text("text"))
+    return _join_page_texts(texts)
+
+# Parsed uploads are cached by content, so script reruns (e.g. changing a sidebar
+# setting) skip re-extraction. Image-only PDFs are cached as None so reruns don't
+# parse them again; exceptions are not cached and surface below.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _extract_pdf_text(pdf_bytes):
+    text = None
+    if PDFTOTEXT:
+        try:
+            # pdftotext ends every page with a form feed
+            text = _join_page_texts(_pdftotext_parallel(pdf_bytes).split("\f")).strip()
+        except (OSError, subprocess.CalledProcessError):
+            pass  # Fall back to PyMuPDF
+    if text is None:
+        text = _pymupdf(pdf_bytes).strip()
+    return text or None
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _extract_txt_text(txt_bytes):
+    # No .strip(), which would copy the whole text again; surrounding whitespace
+    # is left for the summarizer's own cleanup
+    return txt_bytes.decode('utf-8', 'replace')
 
 # Handle PDF upload
 def extract_text_from_pdf(pdf_file):
     try:
-        reader = PyPDF2.PdfReader(pdf_file)
-        return "\n".join([page.extract_text() for page in reader.pages if page.extract_text()]).strip()
+        text = _extract_pdf_text(pdf_file.getvalue())
     except Exception as e:
         st.error(f"Error reading PDF: {str(e)}")
         return None
+    if text is None:
+        st.error(f"⚠️ {SCANNED_PDF_MESSAGE}")
+    return text
 
 # Handle TXT upload
 def extract_text_from_txt(txt_file):
     try:
-        return txt_file.read().decode('utf-8').strip()
+        return _extract_txt_text(txt_file.getvalue())
     except Exception as e:
         st.error(f"Error reading text file: {str(e)}")
         return None
@@ -47,7 +183,13 @@ def main():
 
     with st.sidebar:
         st.header("⚙️ Settings")
-        summary_length = st.selectbox("Summary Length:", ["short", "medium", "long"], index=1)
+        model_name = st.selectbox("Model:", AVAILABLE_MODELS, index=0)
+        summary_length = st.selectbox(
+            "Summary Length:",
+            ["short", "medium", "long"],
+            index=1,
+            help="Short streams word by word; medium and long use beam search and appear when complete."
+        )
         input_method = st.radio("Input Method:", ["Text Input", "File Upload"])
 
         st.markdown("### 💡 Tips")
@@ -58,7 +200,9 @@ def main():
         """)
 
         st.markdown("---")
-        st.info("Model: `facebook/bart-large-cnn`\nPowered by Hugging Face + Streamlit")
+        st.info(f"Model: `{model_name}`\nPowered by Hugging Face + Streamlit")
+        device = "cpu" if is_onnx_model_dir(model_name) else get_default_device().type
+        st.caption(f"Running on {device.upper()}")
 
     col1, col2 = st.columns([3, 2])
     summary = ""
@@ -78,7 +222,7 @@ def main():
                     elif uploaded_file.type == "text/plain":
                         text_to_summarize = extract_text_from_txt(uploaded_file)
 
-                    if text_to_summarize:
+                    if text_to_summarize and text_to_summarize.strip():
                         st.success(f"✅ File loaded! ({len(text_to_summarize)} characters)")
                         with st.expander("📄 Preview"):
                             preview = text_to_summarize[:1000] + "..." if len(text_to_summarize) > 1000 else text_to_summarize
@@ -95,23 +239,33 @@ def main():
                 st.error("⚠️ Please provide at least 50 characters.")
             else:
                 try:
-                    summarizer = load_summarizer()
-
                     with summary_container:
-                        st.info("🔄 Generating summary...")
-                        progress = st.progress(0)
-                        for i in range(100):
-                            time.sleep(0.01)
-                            progress.progress(i + 1)
+                        status = st.empty()
+                        status.info("🔄 Generating summary...")
+                        st.markdown("### 📄 Summary:")
+                        summary_placeholder = st.empty()
 
                         start_time = time.time()
-                        summary = summarizer.summarize(text_to_summarize, length=summary_length)
+                        cache_key = _summary_key(text_to_summarize, summary_length, model_name)
+                        summary = get_cached_summary(cache_key)
+
+                        if summary is not None:
+                            summary_placeholder.markdown(summary)
+                        else:
+                            # ✅ Show the summary as it is decoded; the spinner covers
+                            # beam search presets, which only yield once finished
+                            summarizer = load_summarizer(model_name)
+                            with st.spinner("Generating summary..."):
+                                encoded = get_encoded_input(summarizer, text_to_summarize, model_name)
+                                summary = ""
+                                for new_text in summarizer.summarize_stream_from_ids(encoded, length=summary_length):
+                                    summary += new_text
+                                    summary_placeholder.markdown(summary)
+                            summary = summary.strip()
+                            store_summary(cache_key, summary)
                         end_time = time.time()
-                        progress.empty()
 
-                        st.success("✅ Summary Generated!")
-                        st.markdown("### 📄 Summary:")
-                        st.write(summary)  # ✅ Display summary properly
+                        status.success("✅ Summary Generated!")
 
                         # 📊 Stats
                         original_len = len(text_to_summarize)